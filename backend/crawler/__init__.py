@@ -0,0 +1,10 @@
+"""
+The crawler Django project.
+
+Importing the package loads the Celery app (see `celery.py`), so shared tasks bind
+to it when Django starts.
+"""
+
+from .celery import app as celery_app
+
+__all__ = ("celery_app",)
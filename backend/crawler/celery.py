@@ -0,0 +1,20 @@
+"""
+celery.py
+
+This module configures the Celery application used to run crawls outside the web
+process. The broker and result backend are the Redis instance already used for
+channels and caching; settings prefixed with `CELERY_` in `crawler.settings` are
+picked up automatically.
+
+Typical usage:
+--------------
+celery -A crawler worker --loglevel=info
+"""
+
+import os
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "crawler.settings")
+
+app = Celery("crawler", include=["crawler.tasks"])
+app.config_from_object("django.conf:settings", namespace="CELERY")
@@ -6,8 +6,8 @@ connections, listens to a crawl-related group, and sends live updates (e.g., tot
 error counts, etc.) to the front-end.
 """
 
-import json
 from typing import Dict, Any
+import orjson
 from channels.generic.websocket import AsyncWebsocketConsumer
 
 class CrawlerConsumer(AsyncWebsocketConsumer):
@@ -21,9 +21,9 @@ class CrawlerConsumer(AsyncWebsocketConsumer):
     self.group_name = "crawl_group"
     await self.channel_layer.group_add(self.group_name, self.channel_name)
     await self.accept()
-    await self.send(text_data=json.dumps({
+    await self.send(text_data=orjson.dumps({
       "message": "Connected to crawl WebSocket."
-    }))
+    }).decode())
 
   async def disconnect(self, close_code: int) -> None:
     """Handles disconnection from the WebSocket by leaving the group.
@@ -40,4 +40,4 @@ class CrawlerConsumer(AsyncWebsocketConsumer):
     Args:
         event (Dict[str, Any]): The event containing `stats_data` to be sent.
     """
-    await self.send(text_data=json.dumps(event["stats_data"]))
+    await self.send(text_data=orjson.dumps(event["stats_data"]).decode())
@@ -0,0 +1,38 @@
+"""
+crawler_serializer.py
+
+This module defines the CrawlRequestSerializer, which validates and coerces the body of
+a crawl start request in a single pass before a crawl is queued. Invalid input is
+reported field by field instead of failing later in the crawler.
+
+Typical usage:
+--------------
+serializer = CrawlRequestSerializer(data=request.data)
+if serializer.is_valid():
+    url = serializer.validated_data["url"]
+"""
+
+from rest_framework import serializers
+
+DEFAULT_BLACKLIST = [".jpg", ".png", ".css", ".js", ".pdf"]
+
+
+class CrawlRequestSerializer(serializers.Serializer):
+    """Validates a request to start a crawl.
+
+    Fields:
+        url (str): The starting point for the crawl. (required)
+        max_depth (int): Maximum depth to crawl from the start URL, between 0 and 10.
+            Default is 2.
+        domains (list): Domain names to restrict crawling to. Default is no
+            restriction.
+        blacklist (list): File extensions to avoid crawling. Default is
+            `DEFAULT_BLACKLIST`.
+    """
+
+    url = serializers.URLField()
+    max_depth = serializers.IntegerField(default=2, min_value=0, max_value=10)
+    domains = serializers.ListField(child=serializers.CharField(), default=list)
+    blacklist = serializers.ListField(
+        child=serializers.CharField(), default=lambda: list(DEFAULT_BLACKLIST)
+    )
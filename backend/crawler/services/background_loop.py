@@ -0,0 +1,69 @@
+"""
+background_loop.py
+
+This module owns a single long-lived asyncio event loop running in a daemon thread.
+Crawls started from synchronous code (such as DRF views) are scheduled onto it with
+`submit`, instead of spawning a new thread and event loop for every crawl.
+
+Typical usage:
+--------------
+future = submit(crawler.crawl("https://example.com"))
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Coroutine
+
+logger = logging.getLogger("crawler")
+
+_loop = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its thread on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: The running background loop.
+    """
+
+    global _loop
+
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_loop.run_forever, name="crawler-event-loop", daemon=True
+            )
+            thread.start()
+            logger.info("Started background crawler event loop.")
+
+    return _loop
+
+
+def _log_failure(future: Future) -> None:
+    """Log the exception of a finished background coroutine, if any.
+
+    Args:
+        future (Future): The future returned by `submit`.
+    """
+
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Background crawl failed", exc_info=future.exception())
+
+
+def submit(coro: Coroutine) -> Future:
+    """Schedule a coroutine on the background event loop.
+
+    Args:
+        coro (Coroutine): The coroutine to run, e.g. `crawler.crawl(url)`.
+
+    Returns:
+        Future: A thread-safe future resolving to the coroutine's result.
+    """
+
+    future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    future.add_done_callback(_log_failure)
+    return future
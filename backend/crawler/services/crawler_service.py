@@ -1,16 +1,21 @@
 """
 crawler_service.py
 
-This module defines a simple, configurable web crawler using Python's standard libraries
-and BeautifulSoup.
+This module defines a simple, configurable web crawler using aiohttp and selectolax
+(falling back to the standard library's HTML parser when selectolax is not installed).
 It includes the following components:
 
+- `canonicalize`: Normalizes URLs into a dedup key so that equivalent spellings are
+crawled only once.
+- `url_digest`: 64-bit hash identifying a URL in the visited set and the page cache.
 - `CrawlerConfig`: Configuration options for allowed domains, blacklisted file extensions,
 and maximum crawl depth.
 - `CrawlStats`: Collects and summarizes statistics from the crawl, including status codes,
 content sizes, and titles.
 - `WebCrawler`: Core class that performs a breadth-first crawl of web pages starting from
-a given URL.
+a given URL. Every page of a BFS level is fetched concurrently, bounded by a semaphore,
+with requests interleaved round-robin across hosts. DNS lookups go through the
+in-process cache of `dns_cache`.
 
 The crawler respects domain restrictions and avoids crawling URLs with disallowed file extensions.
 It extracts titles from HTML pages and gathers analytics while handling failures gracefully.
@@ -19,49 +24,417 @@ Typical usage:
 --------------
 config = CrawlerConfig(max_depth=2, domains=["example.com"], blacklist=[".pdf", ".jpg"])
 crawler = WebCrawler(config)
-stats = crawler.crawl("https://example.com")
+stats = crawler.crawl_sync("https://example.com")  # or `await crawler.crawl(...)`
 
 Returns a `CrawlStats` object with metadata about each visited page.
 """
 
-import mimetypes
+import asyncio
+from array import array
+import html
+import html.parser
 import logging
-from urllib.parse import urlparse, urljoin
-from collections import deque, defaultdict
-from bs4 import BeautifulSoup
-import requests
+import os
+import re
+import socket
+import time
+from urllib.parse import urlparse, urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from collections import Counter, deque, OrderedDict
+import aiohttp
 from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from pybloom_live import ScalableBloomFilter
+import xxhash
+
+from crawler.services import dns_cache
+from crawler.services.dns_cache import CachedResolver, create_session
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError: # pragma: no cover - depends on the environment
+    HTMLParser = None
 
 REDIS_TTL = 60 * 60 * 24 # 24 hours
+# Versioned: cached pages store their links as (url, canonical) pairs.
+CACHE_KEY_PREFIX = "page:v2:"
+
+# Besides successful (2xx) responses, only these permanent error statuses are
+# cached; temporary ones (403, 408, 429, 5xx, ...) are fetched again next crawl.
+CACHEABLE_ERROR_STATUSES = frozenset({404, 410})
+
+# Retry policy for transient connection failures.
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.2 # seconds, doubled on every attempt
+
+# Response bodies are streamed in chunks and truncated past this size; the title
+# and most links live near the top of a page.
+MAX_BODY_BYTES = 2 * 1024 * 1024 # 2 MiB
+CHUNK_SIZE = 64 * 1024
+
+# Sizing of the Bloom filter that tracks visited URLs. It grows automatically past
+# the initial capacity while keeping the overall false-positive rate bounded.
+VISITED_INITIAL_CAPACITY = 100_000
+VISITED_ERROR_RATE = 1e-4
+
+# Number of recently visited URLs also kept in an exact LRU in front of the Bloom
+# filter; repeated links (navigation, pagination) are mostly answered from here.
+VISITED_LRU_SIZE = 4096
+
+# Number of most recent per-URL results kept in memory (and broadcast) per crawl;
+# older results only remain in the aggregate counts.
+RESULTS_CAPACITY = 10_000
+
+# Only responses with these content types are parsed for a title and links.
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml")
+PREFLIGHT_HTML_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+
+# Minimum seconds between two live stats broadcasts during a crawl.
+BROADCAST_INTERVAL = 0.25
+
+# HTML parser backend for titles: "selectolax" (default) or "stdlib".
+USE_SELECTOLAX = (
+    HTMLParser is not None
+    and os.environ.get("CRAWLER_HTML_PARSER", "selectolax") == "selectolax"
+)
+
+# Runs of slashes in a URL path, collapsed to one during canonicalization.
+_DUPLICATE_SLASHES_RE = re.compile(r"/{2,}")
+
+# End of the first title element; only the document up to here is parsed.
+_TITLE_END_RE = re.compile(rb"</title\s*>", re.IGNORECASE)
+
+# Charset declared by a <meta> tag, used when the response headers declare none.
+_META_CHARSET_RE = re.compile(rb"""<meta\s[^>]*?charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+
+# Ports that are implied by the scheme and dropped during canonicalization.
+_DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+
+# Matches the href attribute of anchor tags, quoted or not, in raw HTML bytes.
+_HREF_RE = re.compile(
+    rb"""<a\s(?:[^>]*?\s)?href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""",
+    re.IGNORECASE,
+)
 
 logger = logging.getLogger("crawler")
 
 
+def canonicalize(url: str) -> str:
+    """Normalize a URL so that equivalent spellings map to the same string.
+
+    The scheme and host are lowercased (userinfo is kept as-is), the default port
+    is dropped, repeated slashes in the path are collapsed, a trailing slash is
+    removed (except for the root path, which is always "/"), query parameters are
+    sorted, and the fragment is discarded. For example,
+    `HTTP://Example.com:80//a/?b=2&a=1#top` becomes `http://example.com/a?a=1&b=2`.
+
+    The result is only a deduplication key (see `url_digest`): it does not always
+    name the same resource, so URLs are fetched, and relative links resolved
+    against them, as written.
+
+    Args:
+        url (str): An absolute URL.
+
+    Returns:
+        str: The canonical form of the URL.
+    """
+
+    scheme, netloc, path, query, _ = urlsplit(url)
+    scheme = scheme.lower()
+    userinfo, at, host = netloc.rpartition("@")
+    netloc = userinfo + at + host.lower()
+
+    default_port = _DEFAULT_PORTS.get(scheme)
+    if default_port and netloc.endswith(default_port):
+        netloc = netloc[: -len(default_port)]
+
+    if "//" in path:
+        path = _DUPLICATE_SLASHES_RE.sub("/", path)
+    if len(path) > 1 and path.endswith("/"):
+        path = path[:-1]
+    if not path:
+        path = "/"
+
+    if query:
+        query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def url_digest(url: str) -> int:
+    """Return the 64-bit digest identifying a URL in the visited set and the page cache.
+
+    Equivalent spellings of a URL share a digest, since it is computed over the
+    canonical form.
+
+    Args:
+        url (str): An absolute URL.
+
+    Returns:
+        int: The XXH3 64-bit hash of the UTF-8 encoded canonical URL.
+    """
+
+    return _digest_canonical(canonicalize(url))
+
+
+def _digest_canonical(canonical: str) -> int:
+    """Return `url_digest` of a URL that is already canonical."""
+
+    return xxhash.xxh3_64_intdigest(canonical.encode("utf-8"))
+
+
+def _cache_key(url: str) -> str:
+    """Return the page cache key of a URL: the prefix and its 64-bit digest in hex.
+
+    Args:
+        url (str): An absolute URL.
+
+    Returns:
+        str: A fixed-length cache key.
+    """
+
+    return f"{CACHE_KEY_PREFIX}{url_digest(url):016x}"
+
+
+def _extract_links(body: bytes, base_url: str) -> list:
+    """Extract the absolute http(s) links of an HTML document, deduplicated.
+
+    Links are found with a single regex scan over the bytes instead of building a
+    DOM. This is approximate (it does not understand comments or scripts), which is
+    fine for seeding a BFS since every link is still filtered before it is crawled.
+    Absolute hrefs skip `urljoin`, which is the common case on most pages. Links
+    are deduplicated by their canonical form but kept as written (minus the
+    fragment), so they are fetched exactly as the page links to them. The
+    canonical form is returned alongside, so `WebCrawler._admit` does not
+    compute it again on the event loop.
+
+    Args:
+        body (bytes): The raw HTML document.
+        base_url (str): URL of the document as fetched, used to resolve relative
+            hrefs.
+
+    Returns:
+        list: `(url, canonical)` pairs of the unique absolute links, in document
+        order.
+    """
+
+    links = {}
+    unescape = html.unescape
+    for match in _HREF_RE.finditer(body):
+        href = (match.group(1) or match.group(2) or match.group(3) or b"").decode(
+            "utf-8", "ignore"
+        )
+        if "&" in href:
+            href = unescape(href)
+        if not href.startswith(("http://", "https://")):
+            href = urljoin(base_url, href)
+            if not href.startswith("http"):
+                continue
+        if "#" in href:
+            href = href.partition("#")[0]
+        links.setdefault(canonicalize(href), href)
+
+    return [(url, canonical) for canonical, url in links.items()]
+
+
+def _interleave_hosts(frontier: list) -> list:
+    """Reorder a BFS level so that consecutive requests go to different hosts.
+
+    URLs are grouped into one FIFO per host and then taken one per host per round,
+    so a host with many links does not monopolize the global request slots while
+    other hosts sit idle. The order of URLs within a host is preserved.
+
+    Args:
+        frontier (list): `(url, netloc)` pairs of the level.
+
+    Returns:
+        list: The same pairs, in round-robin order over hosts.
+    """
+
+    per_host = {}
+    for entry in frontier:
+        per_host.setdefault(entry[1], deque()).append(entry)
+
+    ordered = []
+    queues = list(per_host.values())
+    while queues:
+        ordered.extend(queue.popleft() for queue in queues)
+        queues = [queue for queue in queues if queue]
+
+    return ordered
+
+
+def _decode_head(head: bytes, charset: str = None) -> str:
+    """Decode the head of a document with its declared charset.
+
+    The charset of the response headers wins, then a `<meta charset>` in the head,
+    then UTF-8. Undecodable bytes and unknown charsets never raise.
+
+    Args:
+        head (bytes): The document prefix to decode.
+        charset (str): Charset from the response's Content-Type, if any.
+
+    Returns:
+        str: The decoded prefix.
+    """
+
+    if charset is None:
+        match = _META_CHARSET_RE.search(head)
+        charset = match.group(1).decode("ascii") if match else "utf-8"
+
+    try:
+        return head.decode(charset, "replace")
+    except LookupError:
+        return head.decode("utf-8", "replace")
+
+
+class _TitleFound(Exception):
+    """Raised by `_TitleParser` to stop parsing at the end of the title."""
+
+
+class _TitleParser(html.parser.HTMLParser):
+    """Streaming standard-library parser that collects the text of the first title.
+
+    Parsing stops as soon as `</title>` is seen, so nothing after the title is
+    tokenized.
+
+    Attributes:
+        parts (list): Text fragments of the title seen so far.
+    """
+
+    def __init__(self):
+        """Initialize the parser with character references converted in text."""
+
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        """Start collecting text when the title element opens."""
+
+        if tag == "title":
+            self._in_title = True
+
+    def handle_data(self, data):
+        """Collect text inside the title element."""
+
+        if self._in_title:
+            self.parts.append(data)
+
+    def handle_endtag(self, tag):
+        """Stop parsing when the title element closes."""
+
+        if tag == "title":
+            raise _TitleFound
+
+
+def _stdlib_title(head: str) -> str:
+    """Extract the title of a document prefix with the standard-library parser.
+
+    Args:
+        head (str): The decoded document prefix, up to and including `</title>`.
+
+    Returns:
+        str: The stripped title, or an empty string if there is none.
+    """
+
+    parser = _TitleParser()
+    try:
+        parser.feed(head)
+        parser.close()
+    except _TitleFound:
+        pass
+
+    return "".join(parser.parts).strip()
+
+
+def _parse_html(body: bytes, base_url: str, charset: str = None) -> tuple:
+    """Extract the page title and outgoing links from an HTML document.
+
+    Only the prefix of the document up to the first `</title>` is decoded and
+    handed to the HTML parser (selectolax's Lexbor C parser when available,
+    otherwise the streaming `_TitleParser`), so the cost of reading the title does not
+    grow with the page body. Links are scanned from the raw bytes; the body as a
+    whole is never decoded.
+
+    Args:
+        body (bytes): The raw HTML document.
+        base_url (str): URL of the document, used to resolve relative links.
+        charset (str): Charset from the response's Content-Type, if any.
+
+    Returns:
+        tuple: The stripped title (empty if missing) and the `(url, canonical)`
+        pairs of the absolute links (see `_extract_links`).
+    """
+
+    title = ""
+    title_end = _TITLE_END_RE.search(body)
+    if title_end is not None:
+        head = _decode_head(body[: title_end.end()], charset)
+        if USE_SELECTOLAX:
+            title_node = HTMLParser(head).css_first("title")
+            title = title_node.text(strip=True) if title_node else ""
+        else:
+            title = _stdlib_title(head)
+
+    return title, _extract_links(body, base_url)
+
+
 class CrawlerConfig:
     """Configuration class for the web crawler.
 
     Attributes:
         max_depth (int): Maximum depth to crawl from the starting URL.
-        allowed_domains (list): List of domains allowed to be crawled.
-        blacklist (list): List of file extensions or patterns to avoid.
+        allowed_domains (frozenset): Lowercased domains allowed to be crawled.
+        blacklist (frozenset): Lowercased file extensions to avoid, including the
+            leading dot (e.g. ".pdf").
+        concurrency (int): Maximum number of in-flight requests.
+        head_preflight (bool): Whether to send a HEAD request before fetching URLs
+            without a file extension, skipping them if they are not HTML.
+        per_host_concurrency (int): Maximum number of in-flight requests per host.
+        per_host_rate (float): Maximum request starts per second per host, or None
+            for no rate limit.
+        use_cache (bool): Whether fetched pages are read from and written to the
+            Redis cache.
     """
 
-    def __init__(self, max_depth=2, domains=None, blacklist=None):
+    def __init__(
+        self,
+        max_depth=2,
+        domains=None,
+        blacklist=None,
+        concurrency=10,
+        head_preflight=False,
+        per_host_concurrency=4,
+        per_host_rate=None,
+        use_cache=True,
+    ):
         """Initialize CrawlerConfig.
 
         Args:
             max_depth (int): Maximum crawl depth.
             domains (list): Allowed domains.
-            blacklist (list): Disallowed file extensions.
+            blacklist (list): Disallowed file extensions, including the leading dot.
+            concurrency (int): Maximum number of concurrent requests.
+            head_preflight (bool): Enable HEAD preflight for extensionless URLs.
+            per_host_concurrency (int): Maximum concurrent requests per host.
+            per_host_rate (float): Maximum requests per second per host.
+            use_cache (bool): Enable the Redis page cache.
         """
         self.max_depth = max_depth
-        self.allowed_domains = domains or []
-        self.blacklist = blacklist or []
+        self.allowed_domains = frozenset(domain.lower() for domain in (domains or ()))
+        self.blacklist = frozenset(ext.lower() for ext in (blacklist or ()))
+        self.concurrency = concurrency
+        self.head_preflight = head_preflight
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_rate = per_host_rate
+        self.use_cache = use_cache
 
-    def is_allowed_domain(self, url: str) -> list:
+    def is_allowed_domain(self, url: str) -> bool:
         """Check if the domain of the given URL is allowed.
 
+        The check runs on the canonical form of the URL (see `canonicalize`), so
+        hostnames are compared case-insensitively and a default port is ignored.
+
         Args:
             url (str): The URL to check.
 
@@ -73,12 +446,15 @@ class CrawlerConfig:
         if not self.allowed_domains:
             return True
 
-        domain = urlparse(url).netloc
-
-        return domain in self.allowed_domains
+        return urlsplit(canonicalize(url)).netloc in self.allowed_domains
 
     def is_blacklisted(self, url: str) -> bool:
-        """Check if the URL is blacklisted based on file extension.
+        """Check if the URL is blacklisted based on the file extension of its path.
+
+        Only the path of the canonical URL is considered, so query strings and
+        fragments never match and a trailing slash does not hide the extension.
+        The check is a single hash lookup of the path's extension in the
+        `blacklist` frozenset, whatever the number of entries.
 
         Args:
             url (str): The URL to check.
@@ -87,11 +463,49 @@ class CrawlerConfig:
             bool: True if the URL is blacklisted.
         """
 
-        ext = mimetypes.guess_extension(urlparse(url).path)
-        if not ext:
-            ext = "." + url.split(".")[-1]
+        if not self.blacklist:
+            return False
+
+        return os.path.splitext(urlsplit(canonicalize(url)).path)[1].lower() in self.blacklist
+
+
+def _compile_url_filter(config: CrawlerConfig):
+    """Build a predicate deciding whether a canonical URL may be crawled under `config`.
+
+    The domain and blacklist checks of `config` are specialized into a closure
+    over their frozensets: a check whose list is empty is left out entirely, and
+    the per-URL cost is at most one set lookup per enabled rule, with no
+    attribute lookups. The config is expected not to change during a crawl.
+
+    The predicate takes the already split netloc and path of a canonical URL.
+    `CrawlerConfig.is_allowed_domain` and `CrawlerConfig.is_blacklisted` check
+    the canonical form too, so both give the same answers.
+
+    Args:
+        config (CrawlerConfig): The configuration to specialize on.
 
-        return ext.lower() in self.blacklist
+    Returns:
+        Callable[[str, str], bool]: `should_crawl(netloc, path)`.
+    """
+
+    allowed = config.allowed_domains
+    blacklist = config.blacklist
+    splitext = os.path.splitext
+
+    if allowed and blacklist:
+        def should_crawl(netloc, path):
+            return netloc in allowed and splitext(path)[1].lower() not in blacklist
+    elif allowed:
+        def should_crawl(netloc, _path):
+            return netloc in allowed
+    elif blacklist:
+        def should_crawl(_netloc, path):
+            return splitext(path)[1].lower() not in blacklist
+    else:
+        def should_crawl(_netloc, _path):
+            return True
+
+    return should_crawl
 
 
 class CrawlStats:
@@ -100,19 +514,50 @@ class CrawlStats:
     Attributes:
         total_urls (int): Total number of URLs crawled.
         errors (int): Total number of failed requests.
-        status_code_counts (dict): Count of HTTP status codes encountered.
-        domain_counts (dict): Count of crawled URLs per domain.
-        results (list): List of crawl result metadata.
+        status_code_counts (Counter): Count of HTTP status codes encountered, keyed
+            by the status code as a string so it can be broadcast as-is.
+        domain_counts (Counter): Count of crawled URLs per domain.
+        results (list): List of crawl result metadata, built on access.
+        capacity (int): Maximum number of per-URL results kept.
+
+    Per-URL results are stored column-wise (one list or typed array per field)
+    rather than as one dict per URL, and are usually recorded a whole BFS level
+    at a time with `record_many`. Only the `capacity` most recent results are
+    kept, so memory and broadcast size stay bounded on long crawls; the totals
+    and counts cover every recorded URL.
     """
 
-    def __init__(self):
-        """Initialize crawl statistics."""
+    def __init__(self, capacity: int = RESULTS_CAPACITY):
+        """Initialize crawl statistics.
+
+        Args:
+            capacity (int): Maximum number of per-URL results kept.
+        """
 
+        self.capacity = capacity
         self.total_urls = 0
         self.errors = 0
-        self.status_code_counts = defaultdict(int)
-        self.domain_counts = defaultdict(int)
-        self.results = []
+        self.status_code_counts = Counter()
+        self.domain_counts = Counter()
+        self._urls = []
+        self._statuses = array("H")
+        self._sizes = array("Q")
+        self._titles = []
+
+    @property
+    def results(self) -> list:
+        """Crawl result metadata as a list of dicts, one per kept URL, oldest first.
+
+        Returns:
+            list: Dicts with `url`, `status`, `size` and `title` keys.
+        """
+
+        return [
+            {"url": url, "status": status, "size": size, "title": title}
+            for url, status, size, title in zip(
+                self._urls, self._statuses, self._sizes, self._titles
+            )
+        ]
 
     def record(
         self, url: str, status_code: int, content_length: int, title: str
@@ -129,16 +574,47 @@ class CrawlStats:
         self.total_urls += 1
         if not 200 <= status_code < 300:
             self.errors += 1
-        self.status_code_counts[status_code] += 1
+        self.status_code_counts[str(status_code)] += 1
         self.domain_counts[urlparse(url).netloc] += 1
-        self.results.append(
-            {
-                "url": url,
-                "status": status_code,
-                "size": content_length,
-                "title": title,
-            }
-        )
+        self._urls.append(url)
+        self._statuses.append(status_code)
+        self._sizes.append(content_length)
+        self._titles.append(title)
+        self._trim()
+
+    def record_many(self, rows: list) -> None:
+        """Record the metadata of a batch of crawled URLs at once.
+
+        The counters and columns are each updated with one bulk call per batch
+        instead of one update per URL.
+
+        Args:
+            rows (list): `(url, status_code, content_length, title, netloc)` tuples.
+        """
+
+        if not rows:
+            return
+
+        urls, statuses, sizes, titles, netlocs = zip(*rows)
+        self.total_urls += len(rows)
+        self.errors += sum(not 200 <= status < 300 for status in statuses)
+        self.status_code_counts.update(map(str, statuses))
+        self.domain_counts.update(netlocs)
+        self._urls.extend(urls)
+        self._statuses.extend(statuses)
+        self._sizes.extend(sizes)
+        self._titles.extend(titles)
+        self._trim()
+
+    def _trim(self) -> None:
+        """Drop the oldest per-URL results beyond `capacity`, one slice per column."""
+
+        excess = len(self._urls) - self.capacity
+        if excess > 0:
+            del self._urls[:excess]
+            del self._statuses[:excess]
+            del self._sizes[:excess]
+            del self._titles[:excess]
 
 
 class WebCrawler:
@@ -146,8 +622,19 @@ class WebCrawler:
 
     Attributes:
         config (CrawlerConfig): Crawler configuration instance.
-        visited (set): Set of already visited URLs.
+        visited (ScalableBloomFilter): Probabilistic set of already visited URLs.
+            A false positive makes the crawler skip a URL it has not seen, at a
+            rate of at most `VISITED_ERROR_RATE`; in exchange memory stays at a
+            few bytes per URL regardless of URL length.
+        visited_lru (OrderedDict): Exact LRU of the most recently visited URLs,
+            checked before the Bloom filter.
         stats (CrawlStats): Object to track crawl statistics.
+        session (aiohttp.ClientSession): Keep-alive session used for the duration of a
+            crawl, either opened by the crawler or shared by the caller.
+
+    Both visited structures are keyed by `url_digest(url)`, a 64-bit int, rather
+    than the URL string: LRU entries stay small and the Bloom filter hashes a
+    short key. Two URLs colliding on 64 bits is negligible at crawl scale.
     """
 
     def __init__(self, config: CrawlerConfig):
@@ -158,10 +645,383 @@ class WebCrawler:
         """
 
         self.config = config
-        self.visited = set()
+        self._should_crawl = _compile_url_filter(config)
+        self.visited = ScalableBloomFilter(
+            initial_capacity=VISITED_INITIAL_CAPACITY, error_rate=VISITED_ERROR_RATE
+        )
+        self.visited_lru = OrderedDict()
         self.stats = CrawlStats()
+        self.session = None
+        self._owns_session = False
+        self._resolver = None
+        self.sem = asyncio.Semaphore(config.concurrency)
+        self._host_sems = {}
+        self._host_next_slot = {}
+        self._prefetched = set()
+        self._prefetch_tasks = set()
+        self._last_broadcast = 0.0
+        self._broadcast_interval = BROADCAST_INTERVAL
+        self._channel_layer = get_channel_layer()
+
+    def seen(self, url: str) -> bool:
+        """Check whether a URL has (probably) been visited during this crawl.
+
+        Args:
+            url (str): The URL to check.
+
+        Returns:
+            bool: True if the URL is in the recent-URL LRU or the Bloom filter.
+        """
+
+        return self._seen_digest(url_digest(url))
+
+    def mark(self, url: str) -> None:
+        """Mark a URL as visited.
 
-    def crawl(self, start_url: str) -> CrawlStats:
+        Args:
+            url (str): The URL being crawled.
+        """
+
+        self._mark_digest(url_digest(url))
+
+    def _seen_digest(self, digest: int) -> bool:
+        """Check whether a URL digest has (probably) been visited; see `seen`."""
+
+        return digest in self.visited_lru or digest in self.visited
+
+    def _mark_digest(self, digest: int) -> None:
+        """Mark a URL digest as visited; see `mark`."""
+
+        self.visited.add(digest)
+        self.visited_lru[digest] = None
+        if len(self.visited_lru) > VISITED_LRU_SIZE:
+            self.visited_lru.popitem(last=False)
+
+    def _admit(self, links: list) -> list:
+        """Select the newly discovered URLs to crawl and mark them as visited.
+
+        URLs already seen, outside the allowed domains, or with a blacklisted
+        extension are dropped here, before they reach a frontier.
+
+        The checks run on the canonical form of each URL, while the URL itself is
+        kept as written for fetching.
+
+        Args:
+            links (list): `(url, canonical)` pairs of absolute URLs, e.g. the
+                links of a page as returned by `_extract_links`.
+
+        Returns:
+            list: `(url, netloc)` pairs of the admitted URLs, in order, where
+            `netloc` is the canonical (lowercase, default-port-free) host.
+        """
+
+        should_crawl = self._should_crawl
+        admitted = []
+        for url, canonical in links:
+            digest = _digest_canonical(canonical)
+            if self._seen_digest(digest):
+                continue
+            parts = urlsplit(canonical)
+            if not should_crawl(parts.netloc, parts.path):
+                logger.debug(f"Blocked by domain or blacklist policy: {url}")
+                continue
+            self._mark_digest(digest)
+            admitted.append((url, parts.netloc))
+
+        return admitted
+
+    def _open_session(self, session: aiohttp.ClientSession = None) -> None:
+        """Set up the HTTP session and DNS resolver used for every request of a crawl.
+
+        Args:
+            session (aiohttp.ClientSession): A session shared by the caller, which
+                is used as-is and left open by `close`. If None, the crawler opens
+                its own pooled keep-alive session.
+        """
+
+        self._resolver = CachedResolver() if dns_cache.DNS_CACHE_ENABLED else None
+        self._owns_session = session is None
+        self.session = create_session(self._resolver) if session is None else session
+
+    async def close(self) -> None:
+        """Close the crawler's own HTTP session and its DNS resolver.
+
+        A session shared by the caller is only released, not closed.
+        """
+
+        for task in self._prefetch_tasks:
+            task.cancel()
+        if self.session is not None and self._owns_session:
+            await self.session.close()
+        self.session = None
+        if self._resolver is not None:
+            await self._resolver.close()
+            self._resolver = None
+
+    async def _prefetch_dns(self, entries: list) -> None:
+        """Resolve the hosts of admitted URLs ahead of fetching them.
+
+        Every distinct host not yet prefetched during this crawl is looked up
+        concurrently through the crawler's `CachedResolver`, with the same key
+        aiohttp's connector uses, so the connections opened afterwards find their
+        addresses in the DNS cache instead of each waiting on a lookup. Only the
+        netloc `_admit` already split out is parsed, once per host and scheme.
+        Lookup failures are ignored; the request itself will report them.
+
+        Args:
+            entries (list): `(url, netloc)` pairs from `_admit`.
+        """
+
+        if self._resolver is None:
+            return
+
+        targets = set()
+        for url, netloc in entries:
+            scheme = "https" if url[:6].lower() == "https:" else "http"
+            if (scheme, netloc) in self._prefetched:
+                continue
+            self._prefetched.add((scheme, netloc))
+            parts = urlsplit(f"{scheme}://{netloc}")
+            try:
+                port = parts.port
+            except ValueError:
+                # Malformed port; the request itself will report the bad URL.
+                continue
+            if parts.hostname:
+                targets.add((parts.hostname, port or (443 if scheme == "https" else 80)))
+
+        # aiohttp's connector resolves with AF_UNSPEC by default.
+        await asyncio.gather(
+            *(self._resolver.resolve(host, port, socket.AF_UNSPEC) for host, port in targets),
+            return_exceptions=True,
+        )
+
+    def _schedule_prefetch(self, entries: list) -> None:
+        """Start resolving the hosts of newly admitted links in the background.
+
+        Called as soon as a page is parsed, so the lookups overlap with the
+        pages of the level that are still downloading; see `_prefetch_dns`.
+
+        Args:
+            entries (list): `(url, netloc)` pairs of the links `_admit` accepted.
+        """
+
+        if self._resolver is None or not entries:
+            return
+
+        task = asyncio.create_task(self._prefetch_dns(entries))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def _head_preflight(self, url: str) -> tuple:
+        """Send a HEAD request to find out whether a URL serves HTML.
+
+        Args:
+            url (str): The URL to check.
+
+        Returns:
+            tuple: The status code, size, and a None body and charset if the URL
+            serves a non-HTML document, or None if a full GET should follow.
+        """
+
+        async with self.session.head(
+            url, timeout=aiohttp.ClientTimeout(total=5), allow_redirects=True
+        ) as response:
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            if response.status == 200 and content_type not in PREFLIGHT_HTML_TYPES:
+                logger.info(f"Skipping body of {url}: preflight returned {content_type}")
+                return response.status, response.content_length or 0, None, None
+
+        return None
+
+    def _host_sem(self, netloc: str) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent requests to a single host.
+
+        Args:
+            netloc (str): The host (network location) being requested.
+
+        Returns:
+            asyncio.Semaphore: The host's semaphore, created on first use.
+        """
+
+        sem = self._host_sems.get(netloc)
+        if sem is None:
+            sem = self._host_sems[netloc] = asyncio.Semaphore(self.config.per_host_concurrency)
+        return sem
+
+    async def _wait_for_host_slot(self, netloc: str) -> None:
+        """Space out request starts to a host according to `per_host_rate`.
+
+        Each call reserves the next free slot for the host, `1 / per_host_rate`
+        seconds after the previous one, and sleeps until it is reached.
+
+        Args:
+            netloc (str): The host (network location) about to be requested.
+        """
+
+        rate = self.config.per_host_rate
+        if not rate:
+            return
+
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._host_next_slot.get(netloc, now))
+        self._host_next_slot[netloc] = slot + 1 / rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _request(self, url: str) -> tuple:
+        """Send the request(s) for a URL and read its body if it is an HTML page.
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            tuple: The status code, size in bytes, HTML body or None, and charset;
+            see `_fetch`.
+        """
+
+        if (
+            self.config.head_preflight
+            and not os.path.splitext(urlparse(url).path)[1]
+        ):
+            preflight = await self._head_preflight(url)
+            if preflight is not None:
+                return preflight
+
+        async with self.session.get(
+            url, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            content_type = response.headers.get("Content-Type", "").lower()
+            if response.status != 200 or not content_type.startswith(
+                HTML_CONTENT_TYPES
+            ):
+                return response.status, response.content_length or 0, None, None
+
+            chunks = []
+            total = 0
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= MAX_BODY_BYTES:
+                    logger.debug(f"Truncating {url} after {total} bytes.")
+                    break
+            return response.status, total, b"".join(chunks), response.charset
+
+    async def _fetch(self, url: str, depth: int, netloc: str) -> tuple:
+        """Fetch a single URL, holding a semaphore slot for the duration of the request.
+
+        A request first waits for a slot on its host (see `_host_sem` and
+        `_wait_for_host_slot`) and only then for a global slot, so requests queued
+        behind a busy host never hold up requests to other hosts.
+
+        Only successful HTML responses have their body downloaded; for anything
+        else the size is taken from the Content-Length header. With
+        `head_preflight` enabled, URLs without a file extension are first probed
+        with a HEAD request.
+
+        Connection errors and timeouts are retried up to `MAX_RETRIES` times with
+        exponential backoff; the semaphore slots are released while backing off.
+
+        Args:
+            url (str): The URL to fetch.
+            depth (int): Depth of the URL relative to the start URL.
+            netloc (str): Network location of `url`.
+
+        Returns:
+            tuple: The response status code, the response size in bytes, the raw
+            HTML body truncated to roughly `MAX_BODY_BYTES` (None if the response
+            is not a 200 HTML page), and the charset of its Content-Type (None if
+            not declared).
+        """
+
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with self._host_sem(netloc):
+                    await self._wait_for_host_slot(netloc)
+                    async with self.sem:
+                        logger.info(f"Fetching URL: {url} at depth: {depth}")
+                        return await self._request(url)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                delay = RETRY_BACKOFF * 2 ** attempt
+                logger.warning(f"Retrying {url} in {delay}s after error: {str(e)}")
+                await asyncio.sleep(delay)
+
+    async def _fetch_page(self, url: str, depth: int, netloc: str) -> tuple:
+        """Fetch a URL and extract its title and links.
+
+        HTML parsing is CPU-bound, so it runs in a worker thread to keep the event
+        loop (and any WebSocket consumers sharing it) responsive while other
+        requests of the frontier are still in flight. Unless the next level is
+        past the depth limit, the page's links are then admitted to the next
+        level right away and the hosts of the admitted ones resolved in the
+        background (see `_schedule_prefetch`).
+
+        Args:
+            url (str): The URL to fetch.
+            depth (int): Depth of the URL relative to the start URL.
+            netloc (str): Network location of `url`.
+
+        Returns:
+            tuple: The status code, size in bytes, page title, absolute links, and
+            the `_admit` result for those links (None if they were not admitted).
+        """
+
+        status_code, content_length, body, charset = await self._fetch(url, depth, netloc)
+        if body is None:
+            return status_code, content_length, "", [], None
+
+        title, links = await asyncio.to_thread(_parse_html, body, url, charset)
+        admitted = None
+        if depth < self.config.max_depth:
+            admitted = self._admit(links)
+            self._schedule_prefetch(admitted)
+        return status_code, content_length, title, links, admitted
+
+    async def _cache_get_many(self, urls: list) -> dict:
+        """Look up a whole BFS level in the page cache with a single round trip.
+
+        Cache errors are logged and treated as misses.
+
+        Args:
+            urls (list): URLs of the level about to be fetched.
+
+        Returns:
+            dict: Cached `_fetch_page` results keyed by URL, for the URLs found.
+        """
+
+        if not self.config.use_cache or not urls:
+            return {}
+
+        keys = {_cache_key(url): url for url in urls}
+        try:
+            found = await cache.aget_many(list(keys))
+        except Exception as e:
+            logger.warning(f"Page cache lookup failed: {str(e)}")
+            return {}
+
+        return {keys[key]: tuple(value) for key, value in found.items()}
+
+    async def _cache_set_many(self, pages: dict) -> None:
+        """Store the freshly fetched pages of a BFS level with a single round trip.
+
+        Args:
+            pages (dict): `_fetch_page` results keyed by URL.
+        """
+
+        if not self.config.use_cache or not pages:
+            return
+
+        try:
+            await cache.aset_many(
+                {_cache_key(url): page for url, page in pages.items()},
+                timeout=REDIS_TTL,
+            )
+        except Exception as e:
+            logger.warning(f"Page cache write failed: {str(e)}")
+
+    async def crawl(self, start_url: str, session: aiohttp.ClientSession = None) -> CrawlStats:
         """Start crawling from the given URL.
         This is the core method of the crawler that performs a breadth-first
         search (BFS) of web pages starting from a given URL, up to a
@@ -169,8 +1029,25 @@ class WebCrawler:
         (like status codes, apge sizes, and titles), and avoid crawling
         URLs that are outside allowed domains or are blacklisted by extension.
 
+        Links are filtered when they are discovered: only URLs that pass the
+        domain and blacklist checks and were not seen before are marked visited
+        and added to the next level, so a level never holds a URL that will be
+        dropped (see `_admit`).
+
+        The crawl proceeds one BFS level (frontier) at a time: the level is
+        looked up in the page cache in one batch while any of its hosts not yet
+        prefetched (when the linking page was parsed) are resolved, every URL
+        that missed is fetched concurrently (requests are started round-robin
+        over hosts, see `_interleave_hosts`), and the links discovered on those
+        pages form the next frontier. The level's results are recorded in the stats
+        and fresh results written back to the cache, each in one batch.
+
         Args:
             start_url (str): The URL to begin crawling from.
+            session (aiohttp.ClientSession): Optional session shared across crawls
+                (see `crawler.services.http_session`), so connections and TLS
+                sessions to the same hosts are reused. If None, a session is
+                opened for this crawl and closed at the end.
 
         Returns:
             CrawlStats: Object containing crawl statistics and results.
@@ -178,65 +1055,109 @@ class WebCrawler:
 
         logger.info(f"Starting crawl at: {start_url}")
 
-        queue = deque([(start_url, 0)])
+        self.sem = asyncio.Semaphore(self.config.concurrency)
+        self._host_sems = {}
+        self._host_next_slot = {}
+        self._prefetched = set()
+        max_depth = self.config.max_depth
+        frontier = self._admit([(start_url, canonicalize(start_url))]) if max_depth >= 0 else []
+        depth = 0
+        self._open_session(session)
 
-        while queue:
-            current_url, depth = queue.popleft()
-            logger.debug(f"Dequeued URL: {current_url} at depth: {depth}")
+        try:
+            while frontier:
+                urls = [url for url, _ in frontier]
+                cached, _ = await asyncio.gather(
+                    self._cache_get_many(urls), self._prefetch_dns(frontier)
+                )
+                to_fetch = _interleave_hosts(
+                    [(url, netloc) for url, netloc in frontier if url not in cached]
+                )
+                tasks = [
+                    asyncio.create_task(self._fetch_page(url, depth, netloc))
+                    for url, netloc in to_fetch
+                ]
+                responses = dict(zip(
+                    (url for url, _ in to_fetch),
+                    await asyncio.gather(*tasks, return_exceptions=True),
+                ))
+                fresh = {}
+                rows = []
+                next_frontier = []
 
-            if current_url in self.visited:
-                logger.debug(f"Skipping already visited URL: {current_url}")
-                continue
+                for current_url, netloc in frontier:
+                    admitted = None
+                    result = cached.get(current_url)
+                    if result is not None:
+                        logger.debug(f"Cache hit for URL: {current_url}")
+                    else:
+                        result = responses[current_url]
+                        if isinstance(result, Exception):
+                            logger.error(
+                                f"Error fetching URL: {current_url} - {str(result)}",
+                                exc_info=result,
+                            )
+                            rows.append((current_url, 0, 0, "ERROR", netloc))
+                            continue
+                        result, admitted = result[:4], result[4]
 
-            if depth > self.config.max_depth:
-                logger.debug(f"Skipping {current_url} due to depth limit.")
-                continue
+                    status_code, content_length, title, links = result
+                    if current_url not in cached and (
+                        200 <= status_code < 300 or status_code in CACHEABLE_ERROR_STATUSES
+                    ):
+                        fresh[current_url] = result
 
-            if not self.config.is_allowed_domain(
-                current_url
-            ):
-                logger.warning(f"Blocked by domain policy: {current_url}")
-                continue
+                    logger.info(
+                        f"Fetched {current_url} - Status: {status_code}, Size: {content_length}, Title: {title}"
+                    )
+                    rows.append((current_url, status_code, content_length, title, netloc))
 
-            if self.config.is_blacklisted(current_url):
-                logger.warning(f"Blocked by blacklist policy: {current_url}")
-                continue
+                    if depth < max_depth:
+                        if admitted is None:
+                            # Cached pages were not parsed in this crawl.
+                            admitted = self._admit(links)
+                        next_frontier.extend(admitted)
+                        logger.debug(
+                            f"Enqueued {len(admitted)} links from {current_url} at depth {depth + 1}"
+                        )
 
-            self.visited.add(current_url)
+                self.stats.record_many(rows)
+                await self._maybe_broadcast()
+                await self._cache_set_many(fresh)
+                frontier = next_frontier
+                depth += 1
+        finally:
+            await self.close()
 
-            try:
-                logger.info(f"Fetching URL: {current_url}")
+        # Always publish the final stats, even if the last update was throttled.
+        await self.broadcast_stats()
 
-                response = requests.get(current_url, timeout=10)
-                content_length = len(response.content)
-                soup = BeautifulSoup(response.text, "html.parser")
-                title_tag = soup.find("title")
-                title = title_tag.get_text(strip=True) if title_tag else ""
+        logger.info(f"Crawl completed. Total URLs visited: {self.stats.total_urls}")
+        return self.stats
 
-                logger.info(
-                    f"Fetched {current_url} - Status: {response.status_code}, Size: {content_length}, Title: {title}"
-                )
-                self.stats.record(
-                    current_url, response.status_code, content_length, title
-                )
+    def crawl_sync(self, start_url: str) -> CrawlStats:
+        """Run `crawl` to completion on a fresh event loop.
 
-                # Live broadcast stats to client.
-                async_to_sync(self.broadcast_stats)()
-
-                if depth < self.config.max_depth and response.status_code == 200:
-                    for link in soup.find_all("a", href=True):
-                        href = urljoin(current_url, link["href"])
-                        if href.startswith("http"):
-                            queue.append((href, depth + 1))
-                            logger.debug(f"Enqueued link: {href} at depth {depth + 1}")
-            except Exception as e:
-                logger.exception(f"Error fetching URL: {current_url} - {str(e)}")
-                self.stats.record(current_url, 0, 0, "ERROR")
-                # Live broadcast stats to client.
-                async_to_sync(self.broadcast_stats)()
+        Intended for synchronous callers such as background threads and tests.
 
-        logger.info(f"Crawl completed. Total URLs visited: {self.stats.total_urls}")
-        return self.stats
+        Args:
+            start_url (str): The URL to begin crawling from.
+
+        Returns:
+            CrawlStats: Object containing crawl statistics and results.
+        """
+
+        return asyncio.run(self.crawl(start_url))
+
+    async def _maybe_broadcast(self) -> None:
+        """Live broadcast stats to clients, at most once per `_broadcast_interval` seconds."""
+
+        now = time.monotonic()
+        if now - self._last_broadcast < self._broadcast_interval:
+            return
+
+        self._last_broadcast = now
+        await self.broadcast_stats()
 
     async def broadcast_stats(self):
         """Asynchronously broadcasts the current crawl statistics to all WebSocket clients in the 'crawl_group'.
@@ -251,25 +1172,30 @@ class WebCrawler:
 
         Notes:
             - If the channel layer is not configured or unavailable, the method exits silently.
-            - All dictionary keys are converted to strings to ensure JSON serialization compatibility.
+            - A failed `group_send` (e.g. Redis is down) is logged and does not abort the crawl.
+            - The channel layer is looked up once, when the crawler is created.
+            - The count dictionaries are already keyed by strings, so they are sent without copying.
         """
 
-        channel_layer = get_channel_layer()
+        channel_layer = self._channel_layer
         if channel_layer is None:
             logger.warning("Channel layer not available. Skipping broadcast.")
             return
 
         logger.debug("Broadcasting crawl stats to WebSocket clients.")
-        await channel_layer.group_send(
-            "crawl_group",
-            {
-                "type": "send_crawl_stats",
-                "stats_data": {
-                    "total_urls": self.stats.total_urls,
-                    "errors": self.stats.errors,
-                    "status_counts": {str(k): v for k, v in self.stats.status_code_counts.items()},
-                    "domain_counts": {str(k): v for k, v in self.stats.domain_counts.items()},
-                    "results": self.stats.results,
+        try:
+            await channel_layer.group_send(
+                "crawl_group",
+                {
+                    "type": "send_crawl_stats",
+                    "stats_data": {
+                        "total_urls": self.stats.total_urls,
+                        "errors": self.stats.errors,
+                        "status_counts": self.stats.status_code_counts,
+                        "domain_counts": self.stats.domain_counts,
+                        "results": self.stats.results,
+                    },
                 },
-            },
-        )
+            )
+        except Exception as e:
+            logger.warning(f"Stats broadcast failed: {str(e)}")
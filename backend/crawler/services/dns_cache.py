@@ -0,0 +1,112 @@
+"""
+dns_cache.py
+
+This module holds the DNS and connection plumbing of the crawler: an in-process DNS
+cache shared by every crawl of the process, the `CachedResolver` that serves aiohttp
+lookups from it, and `create_session`, which builds the pooled keep-alive sessions
+crawls run on. It is used by `crawler_service` for per-crawl sessions and by
+`http_session` for the process-wide one.
+
+Typical usage:
+--------------
+resolver = CachedResolver() if DNS_CACHE_ENABLED else None
+session = create_session(resolver)
+"""
+
+import os
+import socket
+import time
+from collections import OrderedDict
+
+import aiohttp
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import DefaultResolver
+
+# In-process DNS cache shared by every crawl. Set CRAWLER_DNS_CACHE=0 to disable.
+DNS_CACHE_ENABLED = os.environ.get("CRAWLER_DNS_CACHE", "1") == "1"
+# Lookups are cached for a fixed time rather than the record TTL: aiohttp's
+# resolvers (including the aiodns one) return addresses without their TTLs.
+DNS_CACHE_TTL = 300 # 5 minutes
+# Maximum number of (host, port, family) lookups kept; the oldest are evicted first.
+DNS_CACHE_MAX_SIZE = 4096
+
+# Entries are kept in insertion order, which is also expiry order since every
+# entry lives for DNS_CACHE_TTL.
+_dns_cache: OrderedDict[tuple, tuple[list, float]] = OrderedDict()
+
+
+class CachedResolver(AbstractResolver):
+    """DNS resolver that memoizes lookups in the module-level `_dns_cache`.
+
+    aiohttp's own DNS cache lives on the connector and is discarded with the
+    session at the end of every crawl; this cache outlives it, so repeated
+    crawls of the same hosts resolve each hostname once per `DNS_CACHE_TTL`,
+    a fixed lifetime since aiohttp's resolvers do not report record TTLs.
+    Expired entries are pruned on insert and at most `DNS_CACHE_MAX_SIZE`
+    lookups are kept, so a long-running worker does not grow it without bound.
+
+    Cache misses go to aiohttp's default resolver, which is the non-blocking
+    c-ares based `AsyncResolver` when aiodns is installed (see requirements.txt)
+    and a thread pool around `getaddrinfo` otherwise.
+    """
+
+    def __init__(self):
+        """Initialize the resolver with aiohttp's default resolver as the backend."""
+
+        self._resolver = DefaultResolver()
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> list:
+        """Resolve a hostname, serving unexpired results from the cache.
+
+        Args:
+            host (str): Hostname to resolve.
+            port (int): Port the connection will be made to.
+            family (int): Address family of the lookup.
+
+        Returns:
+            list: aiohttp `ResolveResult` entries for the host.
+        """
+
+        key = (host, port, family)
+        now = time.monotonic()
+        cached = _dns_cache.get(key)
+        if cached and now < cached[1]:
+            return cached[0]
+
+        result = await self._resolver.resolve(host, port, family)
+        _dns_cache.pop(key, None)
+        _dns_cache[key] = (result, now + DNS_CACHE_TTL)
+        while _dns_cache:
+            oldest = next(iter(_dns_cache.values()))
+            if now < oldest[1] and len(_dns_cache) <= DNS_CACHE_MAX_SIZE:
+                break
+            _dns_cache.popitem(last=False)
+        return result
+
+    async def close(self) -> None:
+        """Release the backend resolver."""
+
+        await self._resolver.close()
+
+
+def create_session(resolver: AbstractResolver = None, limit: int = 100) -> aiohttp.ClientSession:
+    """Create a pooled keep-alive HTTP session bound to the running event loop.
+
+    Args:
+        resolver (AbstractResolver): DNS resolver for the connector, or None for
+            aiohttp's default.
+        limit (int): Maximum number of open connections of the pool.
+
+    Returns:
+        aiohttp.ClientSession: A new session.
+    """
+
+    connector = aiohttp.TCPConnector(
+        resolver=resolver,
+        limit=limit,
+        limit_per_host=64,
+        keepalive_timeout=30,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+    )
+    return aiohttp.ClientSession(connector=connector)
@@ -0,0 +1,85 @@
+"""
+http_session.py
+
+This module owns the aiohttp session shared by every crawl of the process. It lives
+on the background event loop (see `background_loop`), so crawls scheduled there reuse
+its pooled keep-alive connections, TLS sessions and DNS cache instead of opening a
+new session, and paying for new handshakes, per crawl. The session is closed when the
+process exits.
+
+Typical usage:
+--------------
+async def run(url):
+    return await WebCrawler(config).crawl(url, session=await get_session())
+
+stats = submit(run("https://example.com")).result()
+"""
+
+import asyncio
+import atexit
+import logging
+
+import aiohttp
+
+from crawler.services import dns_cache
+from crawler.services.background_loop import get_loop
+from crawler.services.dns_cache import CachedResolver, create_session
+
+logger = logging.getLogger("crawler")
+
+# Connection pool size of the shared session, across all concurrent crawls.
+SHARED_SESSION_LIMIT = 200
+
+# Seconds to wait for the session to close when the process exits.
+CLOSE_TIMEOUT = 5
+
+_session = None
+_resolver = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it on first use.
+
+    Must be awaited on the background event loop, which the session is bound to.
+
+    Returns:
+        aiohttp.ClientSession: The process-wide session.
+    """
+
+    global _session, _resolver
+
+    if _session is None or _session.closed:
+        _resolver = CachedResolver() if dns_cache.DNS_CACHE_ENABLED else None
+        _session = create_session(_resolver, limit=SHARED_SESSION_LIMIT)
+        logger.info("Opened shared crawler HTTP session.")
+
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session and its DNS resolver, if open."""
+
+    global _session, _resolver
+
+    if _session is not None:
+        await _session.close()
+        _session = None
+    if _resolver is not None:
+        await _resolver.close()
+        _resolver = None
+
+
+def _close_at_exit() -> None:
+    """Close the shared session on the background loop at interpreter exit."""
+
+    if _session is None:
+        return
+
+    future = asyncio.run_coroutine_threadsafe(close_session(), get_loop())
+    try:
+        future.result(timeout=CLOSE_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"Failed to close shared HTTP session: {str(e)}")
+
+
+atexit.register(_close_at_exit)
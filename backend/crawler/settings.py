@@ -87,7 +87,7 @@ CHANNEL_LAYERS = {
 # REST Framework
 REST_FRAMEWORK = {
   "DEFAULT_RENDERER_CLASSES": [
-    'rest_framework.renderers.JSONRenderer',
+    "drf_orjson_renderer.renderers.ORJSONRenderer",
   ],
 }
 
@@ -123,6 +123,12 @@ CACHES = {
     }
 }
 
+# Celery
+CELERY_BROKER_URL = f"redis://{env('REDIS_HOST')}:{env('REDIS_PORT')}/2"
+CELERY_RESULT_BACKEND = CELERY_BROKER_URL
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+
 # Configure CORS Allowed Origins
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
@@ -0,0 +1,80 @@
+"""
+tasks.py
+
+This module defines the Celery tasks of the crawler. `crawl_task` runs a
+breadth-first crawl in a worker process, so the API only has to enqueue the job
+and crawls survive restarts of the web server.
+
+Typical usage:
+--------------
+result = crawl_task.delay("https://example.com", {"max_depth": 2, "domains": [], "blacklist": []})
+"""
+
+import logging
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from celery import shared_task
+
+from crawler.services.background_loop import submit
+from crawler.services.crawler_service import WebCrawler, CrawlerConfig, CrawlStats
+from crawler.services.http_session import get_session
+
+logger = logging.getLogger("crawler")
+
+# Seconds to wait before retrying a failed crawl, doubled on every attempt.
+CRAWL_RETRY_BACKOFF = 30
+
+# Seconds a crawl may run before it is cancelled and retried. Celery's time limits
+# cannot interrupt the background loop, and with late acks a task still running
+# past the Redis broker's visibility timeout (1 hour by default) is redelivered,
+# so the limit is enforced here and kept below it.
+CRAWL_TIMEOUT = 30 * 60
+
+
+async def _crawl(url: str, cfg: dict) -> CrawlStats:
+    """Run a crawl on the worker's shared HTTP session.
+
+    Args:
+        url (str): The URL to begin crawling from.
+        cfg (dict): Keyword arguments for `CrawlerConfig`.
+
+    Returns:
+        CrawlStats: Object containing crawl statistics and results.
+    """
+
+    crawler = WebCrawler(CrawlerConfig(**cfg))
+    return await crawler.crawl(url, session=await get_session())
+
+
+@shared_task(bind=True, max_retries=3)
+def crawl_task(self, url: str, cfg: dict) -> dict:
+    """Crawl a website in a Celery worker.
+
+    The crawl runs on the worker's long-lived background event loop, so every
+    task in the worker process shares it and its HTTP session. A crawl that fails as a whole is
+    retried with exponential backoff; failures of individual pages are already
+    recorded in the crawl statistics and do not trigger a retry. A crawl still
+    running after `CRAWL_TIMEOUT` seconds is cancelled on the loop and retried the
+    same way, so a hung crawl never blocks the worker.
+
+    Args:
+        url (str): The URL to begin crawling from.
+        cfg (dict): Keyword arguments for `CrawlerConfig`.
+
+    Returns:
+        dict: Summary of the crawl with `total_urls` and `errors` counts.
+    """
+
+    logger.info(f"Running crawl task {self.request.id} for: {url}")
+
+    future = submit(_crawl(url, cfg))
+    try:
+        stats = future.result(timeout=CRAWL_TIMEOUT)
+    except FutureTimeoutError as e:
+        future.cancel()
+        logger.warning(f"Crawl task {self.request.id} timed out after {CRAWL_TIMEOUT}s")
+        raise self.retry(exc=e, countdown=CRAWL_RETRY_BACKOFF * 2 ** self.request.retries)
+    except Exception as e:
+        logger.warning(f"Crawl task {self.request.id} failed: {str(e)}")
+        raise self.retry(exc=e, countdown=CRAWL_RETRY_BACKOFF * 2 ** self.request.retries)
+
+    return {"total_urls": stats.total_urls, "errors": stats.errors}
@@ -0,0 +1,40 @@
+"""
+Unit tests for background_loop.py
+
+This module verifies that coroutines submitted from synchronous code run to
+completion on the shared background event loop, and that the same loop is reused
+across submissions.
+
+Usage:
+    pytest crawler/tests/services/test_background_loop.py
+"""
+
+import asyncio
+import threading
+from crawler.services.background_loop import get_loop, submit
+
+
+async def _current_loop_and_thread():
+    """Returns the running loop and the name of the thread it runs on."""
+
+    await asyncio.sleep(0)
+    return asyncio.get_running_loop(), threading.current_thread().name
+
+
+def test_submit_runs_on_background_loop():
+    """Ensures submitted coroutines run on the background loop's thread."""
+
+    loop, thread_name = submit(_current_loop_and_thread()).result(timeout=5)
+
+    assert loop is get_loop()
+    assert thread_name == "crawler-event-loop"
+
+
+def test_background_loop_is_reused():
+    """Ensures every submission shares the same long-lived loop."""
+
+    first, _ = submit(_current_loop_and_thread()).result(timeout=5)
+    second, _ = submit(_current_loop_and_thread()).result(timeout=5)
+
+    assert first is second
+    assert first.is_running()
@@ -0,0 +1,65 @@
+"""
+Unit tests for dns_cache.py
+
+This module verifies that the in-process DNS cache serves repeated lookups of a host
+from memory, and that it stays bounded by evicting the oldest lookups past its size
+and dropping expired ones.
+
+Usage:
+    pytest crawler/tests/services/test_dns_cache.py
+"""
+
+import asyncio
+import socket
+from collections import OrderedDict
+from unittest.mock import AsyncMock
+
+from crawler.services import dns_cache
+from crawler.services.dns_cache import CachedResolver
+
+
+def test_dns_cache_resolves_host_once(monkeypatch):
+    """Ensures repeated lookups for the same host are served from the DNS cache."""
+
+    monkeypatch.setattr(dns_cache, "_dns_cache", OrderedDict())
+    addresses = [{"hostname": "example.com", "host": "93.184.216.34", "port": 80}]
+
+    async def resolve_twice():
+        resolver = CachedResolver()
+        resolver._resolver = AsyncMock()
+        resolver._resolver.resolve.return_value = addresses
+        first = await resolver.resolve("example.com", 80)
+        second = await resolver.resolve("example.com", 80)
+        return resolver._resolver.resolve.call_count, first, second
+
+    call_count, first, second = asyncio.run(resolve_twice())
+
+    assert call_count == 1
+    assert first == second == addresses
+
+
+def test_dns_cache_is_bounded(monkeypatch):
+    """Ensures the DNS cache evicts the oldest lookups past its size and drops expired ones."""
+
+    monkeypatch.setattr(dns_cache, "_dns_cache", OrderedDict())
+    monkeypatch.setattr(dns_cache, "DNS_CACHE_MAX_SIZE", 2)
+
+    async def resolve_hosts():
+        resolver = CachedResolver()
+        resolver._resolver = AsyncMock()
+        resolver._resolver.resolve.return_value = []
+        for host in ("a.com", "b.com", "c.com"):
+            await resolver.resolve(host, 80)
+        sized = list(dns_cache._dns_cache)
+        monkeypatch.setattr(dns_cache, "DNS_CACHE_MAX_SIZE", 10)
+        dns_cache._dns_cache[("b.com", 80, socket.AF_INET)] = ([], 0.0)
+        await resolver.resolve("d.com", 80)
+        return sized
+
+    sized = asyncio.run(resolve_hosts())
+
+    assert sized == [("b.com", 80, socket.AF_INET), ("c.com", 80, socket.AF_INET)]
+    assert list(dns_cache._dns_cache) == [
+        ("c.com", 80, socket.AF_INET),
+        ("d.com", 80, socket.AF_INET),
+    ]
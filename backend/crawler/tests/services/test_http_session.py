@@ -0,0 +1,72 @@
+"""
+Unit tests for http_session.py
+
+This module verifies that the shared HTTP session is created once on the background
+loop and reused across crawls, that a crawl leaves a shared session open, that
+the session is recreated after being closed, and that a new session picks up the
+current DNS cache setting.
+
+Usage:
+    pytest crawler/tests/services/test_http_session.py
+"""
+
+import pytest
+from aioresponses import aioresponses
+
+from crawler.services import dns_cache
+from crawler.services.background_loop import submit
+from crawler.services.crawler_service import WebCrawler, CrawlerConfig
+from crawler.services.http_session import close_session, get_session
+
+
+@pytest.fixture(name="no_dns", autouse=True)
+def fixture_no_dns(monkeypatch):
+    """Keeps DNS lookups off the network and closes the shared session after each test."""
+
+    monkeypatch.setattr(dns_cache, "DNS_CACHE_ENABLED", False)
+    yield
+    submit(close_session()).result(timeout=5)
+
+
+def test_session_is_shared():
+    """Ensures every caller gets the same open session until it is closed."""
+
+    first = submit(get_session()).result(timeout=5)
+    second = submit(get_session()).result(timeout=5)
+    submit(close_session()).result(timeout=5)
+    third = submit(get_session()).result(timeout=5)
+
+    assert first is second
+    assert first.closed
+    assert third is not first and not third.closed
+
+
+def test_crawl_leaves_shared_session_open():
+    """Ensures a crawl given the shared session reuses it and does not close it."""
+
+    async def crawl():
+        session = await get_session()
+        crawler = WebCrawler(CrawlerConfig(max_depth=0, use_cache=False))
+        with aioresponses() as mock_http:
+            mock_http.get("http://example.com", status=404, body="")
+            stats = await crawler.crawl("http://example.com", session=session)
+        return session, stats
+
+    session, stats = submit(crawl()).result(timeout=5)
+
+    assert stats.total_urls == 1
+    assert not session.closed
+    assert submit(get_session()).result(timeout=5) is session
+
+
+def test_dns_cache_setting_is_read_per_session(monkeypatch):
+    """Ensures the session honours DNS_CACHE_ENABLED as set when it is created."""
+
+    session = submit(get_session()).result(timeout=5)
+    assert not isinstance(session.connector._resolver, dns_cache.CachedResolver)
+    submit(close_session()).result(timeout=5)
+
+    monkeypatch.setattr(dns_cache, "DNS_CACHE_ENABLED", True)
+    session = submit(get_session()).result(timeout=5)
+
+    assert isinstance(session.connector._resolver, dns_cache.CachedResolver)
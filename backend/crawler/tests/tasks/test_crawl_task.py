@@ -0,0 +1,85 @@
+"""
+Unit tests for tasks.py
+
+This module verifies that `crawl_task` builds the crawler from its config
+dictionary, runs the crawl on the background loop with the shared HTTP session and
+returns a summary, and that a failed or timed out crawl is retried.
+
+Usage:
+    pytest crawler/tests/tasks/test_crawl_task.py
+"""
+
+import asyncio
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from unittest.mock import AsyncMock, patch
+import pytest
+from celery.exceptions import Retry
+
+from crawler.services.crawler_service import CrawlStats
+from crawler.tasks import crawl_task
+
+
+@patch("crawler.tasks.get_session", new_callable=AsyncMock)
+@patch("crawler.tasks.WebCrawler")
+def test_crawl_task_runs_crawl(mock_crawler, mock_get_session):
+    """Ensures the task configures the crawler from `cfg` and returns the crawl summary."""
+
+    stats = CrawlStats()
+    stats.record("https://example.com/", 200, 10, "Home")
+    stats.record("https://example.com/missing", 404, 0, "")
+    mock_crawler.return_value.crawl = AsyncMock(return_value=stats)
+
+    summary = crawl_task.apply(
+        args=("https://example.com", {"max_depth": 1, "domains": ["example.com"]})
+    ).get()
+
+    assert summary == {"total_urls": 2, "errors": 1}
+    config = mock_crawler.call_args.args[0]
+    assert config.max_depth == 1
+    assert config.allowed_domains == {"example.com"}
+    mock_crawler.return_value.crawl.assert_awaited_once_with(
+        "https://example.com", session=mock_get_session.return_value
+    )
+
+
+@patch("crawler.tasks.crawl_task.retry", side_effect=Retry())
+@patch("crawler.tasks.get_session", new_callable=AsyncMock)
+@patch("crawler.tasks.WebCrawler")
+def test_crawl_task_retries_on_failure(mock_crawler, _mock_get_session, mock_retry):
+    """Ensures a crawl that raises is retried with the original exception."""
+
+    error = RuntimeError("boom")
+    mock_crawler.return_value.crawl = AsyncMock(side_effect=error)
+
+    with pytest.raises(Retry):
+        crawl_task.apply(args=("https://example.com", {}), throw=True).get()
+
+    mock_retry.assert_called_once()
+    assert mock_retry.call_args.kwargs["exc"] is error
+
+
+@patch("crawler.tasks.CRAWL_TIMEOUT", 0.05)
+@patch("crawler.tasks.crawl_task.retry", side_effect=Retry())
+@patch("crawler.tasks.get_session", new_callable=AsyncMock)
+@patch("crawler.tasks.WebCrawler")
+def test_crawl_task_cancels_and_retries_on_timeout(mock_crawler, _mock_get_session, mock_retry):
+    """Ensures a crawl running past the timeout is cancelled on the loop and retried."""
+
+    cancelled = threading.Event()
+
+    async def hang(*_args, **_kwargs):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    mock_crawler.return_value.crawl = hang
+
+    with pytest.raises(Retry):
+        crawl_task.apply(args=("https://example.com", {}), throw=True).get()
+
+    assert cancelled.wait(timeout=5)
+    mock_retry.assert_called_once()
+    assert isinstance(mock_retry.call_args.kwargs["exc"], FutureTimeoutError)
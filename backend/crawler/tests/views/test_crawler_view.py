@@ -2,13 +2,14 @@
 Unit tests for the CrawlerViewSet's 'start' action.
 
 This test suite verifies the behavior of the crawl start endpoint under various conditions:
-- When required fields like 'url' are missing.
+- When required fields like 'url' are missing, or fields are invalid.
 - When valid minimal input is provided.
+- When the response is rendered to JSON.
 - When custom max_depth, domains, and blacklist filters are used.
-- When an internal exception occurs during crawler initialization.
+- When an internal exception occurs while queueing the crawl task.
 
 The tests use pytest fixtures, Django's APIRequestFactory for request simulation,
-and unittest.mock for patching dependencies (like threading, crawler config, and services).
+and unittest.mock for patching dependencies (like the Celery crawl task).
 
 Usage:
     pytest crawler/tests/views/test_crawler_view.py
@@ -17,6 +18,8 @@ Usage:
 from unittest.mock import patch
 import pytest
 import django
+import orjson
+from drf_orjson_renderer.renderers import ORJSONRenderer
 from rest_framework.test import APIRequestFactory
 from rest_framework import status
 
@@ -45,15 +48,35 @@ def test_start_missing_url(factory, view):
     request = factory.post("/api/crawler/start/", data={}, format="json")
     response = view(request)
     assert response.status_code == status.HTTP_400_BAD_REQUEST
-    assert response.data["error"] == "URL is required."
+    assert response.data == {"url": ["This field is required."]}
+
+
+@pytest.mark.parametrize(
+    "data, field",
+    [
+        ({"url": "not a url"}, "url"),
+        ({"url": "https://example.com", "max_depth": "deep"}, "max_depth"),
+        ({"url": "https://example.com", "max_depth": 11}, "max_depth"),
+        ({"url": "https://example.com", "domains": "example.com"}, "domains"),
+    ],
+)
+@patch("crawler.views.crawler_view.crawl_task.delay")
+def test_start_invalid_data(mock_delay, factory, view, data, field):
+    """Test that invalid fields return a 400 response naming the field, without queueing."""
+
+    request = factory.post("/api/crawler/start/", data=data, format="json")
+    response = view(request)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert list(response.data) == [field]
+    mock_delay.assert_not_called()
 
 
-@patch("crawler.views.crawler_view.Thread")
-@patch("crawler.views.crawler_view.WebCrawler")
-@patch("crawler.views.crawler_view.CrawlerConfig")
-def test_start_with_minimal_valid_data(mock_config, mock_crawler, mock_thread, factory, view):
-    """Test crawl starts successfully with only the required URL field."""
+@patch("crawler.views.crawler_view.crawl_task.delay")
+def test_start_with_minimal_valid_data(mock_delay, factory, view):
+    """Test crawl is queued with default settings when only the required URL field is given."""
 
+    mock_delay.return_value.id = "job-1"
     request = factory.post(
         "/api/crawler/start/",
         data={"url": "https://example.com"},
@@ -61,19 +84,29 @@ def test_start_with_minimal_valid_data(mock_config, mock_crawler, mock_thread, f
     )
     response = view(request)
 
-    assert response.status_code == status.HTTP_200_OK
-    assert response.data["message"] == "Crawl started."
-    mock_config.assert_called_once()
-    mock_crawler.assert_called_once()
-    mock_thread.assert_called_once()
-    mock_thread.return_value.start.assert_called_once()
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.data == {"job_id": "job-1", "message": "Crawl queued."}
+    mock_delay.assert_called_once_with(
+        "https://example.com",
+        {"max_depth": 2, "domains": [], "blacklist": [".jpg", ".png", ".css", ".js", ".pdf"]},
+    )
+
 
+@patch("crawler.views.crawler_view.crawl_task.delay")
+def test_start_response_is_rendered_with_orjson(mock_delay, factory, view):
+    """Test the response body is rendered by the orjson renderer."""
 
-@patch("crawler.views.crawler_view.Thread")
-@patch("crawler.views.crawler_view.WebCrawler")
-@patch("crawler.views.crawler_view.CrawlerConfig")
-def test_start_with_custom_depth_and_filters(mock_config, mock_crawler, mock_thread, factory, view):
-    """Test crawl starts correctly when custom depth, domains, and blacklist are provided."""
+    mock_delay.return_value.id = "job-1"
+    request = factory.post("/api/crawler/start/", data={"url": "https://example.com"}, format="json")
+    response = view(request).render()
+
+    assert isinstance(response.accepted_renderer, ORJSONRenderer)
+    assert orjson.loads(response.content) == {"job_id": "job-1", "message": "Crawl queued."}
+
+
+@patch("crawler.views.crawler_view.crawl_task.delay")
+def test_start_with_custom_depth_and_filters(mock_delay, factory, view):
+    """Test crawl is queued correctly when custom depth, domains, and blacklist are provided."""
 
     request = factory.post("/api/crawler/start/", data={
         "url": "https://example.com",
@@ -83,21 +116,38 @@ def test_start_with_custom_depth_and_filters(mock_config, mock_crawler, mock_thr
     }, format="json")
     response = view(request)
 
-    assert response.status_code == status.HTTP_200_OK
-    mock_config.assert_called_once_with(
-        max_depth=3,
-        domains=["example.com"],
-        blacklist=[".jpg", ".gif"]
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    mock_delay.assert_called_once_with(
+        "https://example.com",
+        {"max_depth": 3, "domains": ["example.com"], "blacklist": [".jpg", ".gif"]},
+    )
+
+
+@patch("crawler.views.crawler_view.crawl_task.delay")
+def test_start_with_form_encoded_data(mock_delay, factory, view):
+    """Test the form-encoded body sent by the frontend, with indexed list keys, is parsed."""
+
+    request = factory.post(
+        "/api/crawler/start/",
+        data="url=https%3A%2F%2Fexample.com&max_depth=1&domains%5B0%5D=example.com",
+        content_type="application/x-www-form-urlencoded",
+    )
+    response = view(request)
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    mock_delay.assert_called_once_with(
+        "https://example.com",
+        {
+            "max_depth": 1,
+            "domains": ["example.com"],
+            "blacklist": [".jpg", ".png", ".css", ".js", ".pdf"],
+        },
     )
-    mock_crawler.assert_called_once()
-    mock_thread.assert_called_once()
 
 
-@patch("crawler.views.crawler_view.Thread")
-@patch("crawler.views.crawler_view.WebCrawler")
-@patch("crawler.views.crawler_view.CrawlerConfig", side_effect=Exception("Config error"))
-def test_start_internal_exception(mock_config, mock_crawler, mock_thread, factory, view):
-    """Test that an internal exception during configuration returns a 500 error response."""
+@patch("crawler.views.crawler_view.crawl_task.delay", side_effect=Exception("Broker error"))
+def test_start_internal_exception(mock_delay, factory, view):
+    """Test that an internal exception while queueing the crawl returns a 500 error response."""
 
     request = factory.post(
         "/api/crawler/start/",
@@ -108,6 +158,4 @@ def test_start_internal_exception(mock_config, mock_crawler, mock_thread, factor
 
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
     assert response.data["error"] == "Internal server error"
-    mock_config.assert_called_once()
-    mock_crawler.assert_not_called()
-    mock_thread.assert_not_called()
+    mock_delay.assert_called_once()
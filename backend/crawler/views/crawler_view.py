@@ -3,21 +3,21 @@ crawler_view.py
 
 This module defines the CrawlerViewSet, a Django REST Framework ViewSet responsible for handling
 web crawl initiation requests. It accepts user input such as a starting URL, depth limits,
-domain restrictions, and file type blacklists, then spawns a background thread to perform
-a breadth-first crawl using the configured settings.
+domain restrictions, and file type blacklists, then enqueues a breadth-first crawl using
+the configured settings as a Celery task.
 
 Logging is used extensively for observability, debugging, and traceability.
 """
 
 import logging
-from threading import Thread
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.viewsets import ViewSet
 from rest_framework.decorators import action
 
-from crawler.services.crawler_service import WebCrawler, CrawlerConfig
+from crawler.serializers.crawler_serializer import CrawlRequestSerializer
+from crawler.tasks import crawl_task
 
 logger = logging.getLogger(__name__)
 
@@ -25,53 +25,53 @@ logger = logging.getLogger(__name__)
 class CrawlerViewSet(ViewSet):
     """A ViewSet that provides an API endpoint to initiate a web crawling process.
 
-    This class exposes a `POST /api/crawler/start/` endpoint, which starts a background web crawl
-    using the provided URL and optional configuration parameters like crawl depth, allowed
+    This class exposes a `POST /api/crawler/start/` endpoint, which queues a web crawl for a
+    Celery worker using the provided URL and optional configuration parameters like crawl depth, allowed
     domains, and URL path blacklists.
     """
 
     @action(detail=False, methods=["post"], url_path="start")
     def start(self, request: Request) -> Response:
-        """Handle POST requests to start a web crawl in the background.
+        """Handle POST requests to queue a web crawl for a Celery worker.
 
-        Expects a JSON body with the following keys:
+        Expects a JSON body with the following keys, validated by `CrawlRequestSerializer`:
         - url (str): The starting point for the crawl. (required)
-        - max_depth (int): Maximum depth to crawl from the start URL. Default is 2.
+        - max_depth (int): Maximum depth to crawl from the start URL (0-10). Default is 2.
         - domains (list): List of domain names to restrict crawling to.
         - blacklist (list): List of URL suffixes to avoid crawling (e.g. images, scripts).
 
         Returns:
-            Response: A success message if the thread was started, or an error message.
+            Response: A 202 response with the Celery job id if the crawl was queued, a
+            400 response with the errors of each invalid field, or an error message.
         """
 
-        logger.info("Received crawl request", extra={"request_data": request.data})
+        data = request.data
+        # Skip building the `extra` payloads when INFO logging is disabled.
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info("Received crawl request", extra={"request_data": data})
 
-        url = request.data.get("url")
-        max_depth = int(request.data.get("max_depth", 2))
-        domains = request.data.get("domains", [])
-        blacklist = request.data.get("blacklist", [".jpg", ".png", ".css", ".js", ".pdf"])
+        serializer = CrawlRequestSerializer(data=data)
+        if not serializer.is_valid():
+            logger.warning(f"Invalid crawl request: {serializer.errors}")
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        if not url:
-            logger.warning("Missing 'url' in crawl request")
-            return Response({"error": "URL is required."}, status=status.HTTP_400_BAD_REQUEST)
-
-        logger.info("Initializing crawler config", extra={
-            "url": url,
-            "max_depth": max_depth,
-            "domains": domains,
-            "blacklist": blacklist
-        })
+        cfg = dict(serializer.validated_data)
+        url = cfg.pop("url")
+        if log_info:
+            logger.info("Queueing crawl task", extra={"start_url": url, **cfg})
 
         try:
-            config = CrawlerConfig(max_depth=max_depth, domains=domains, blacklist=blacklist)
-            crawler = WebCrawler(config)
-
-            logger.info("Starting crawler thread", extra={"start_url": url})
-            thread = Thread(target=crawler.crawl, args=(url,))
-            thread.start()
+            result = crawl_task.delay(url, cfg)
 
-            logger.info("Crawl thread started successfully", extra={"thread_name": thread.name})
-            return Response({"message": "Crawl started."}, status=status.HTTP_200_OK)
+            if log_info:
+                logger.info(
+                    "Crawl queued successfully", extra={"start_url": url, "job_id": result.id}
+                )
+            return Response(
+                {"job_id": result.id, "message": "Crawl queued."},
+                status=status.HTTP_202_ACCEPTED,
+            )
 
         except Exception as e:
             logger.exception("Exception occurred while starting crawler: %s", e)